@@ -269,9 +269,11 @@ void setup() {
 
     NimBLEService* pService = pServer->createService(SERVICE_UUID);
 
-    // Galvo control characteristic (write-only)
+    // Galvo control characteristic (write-only). WRITE_NR lets clients use
+    // write-without-response for streaming updates, skipping the per-write
+    // ATT acknowledgement round-trip; plain acknowledged writes still work.
     NimBLECharacteristic* pGalvoChar = pService->createCharacteristic(
-        CHARACTERISTIC_UUID, NIMBLE_PROPERTY::WRITE
+        CHARACTERISTIC_UUID, NIMBLE_PROPERTY::WRITE | NIMBLE_PROPERTY::WRITE_NR
     );
     pGalvoChar->setValue(0.0f);
     pGalvoChar->setCallbacks(new GalvoCallbacks());
@@ -36,6 +36,20 @@ options:
 
 # ── Claude watch mode (web bridge) ──────────────────────────────────────────
 
+# Precompiled galvo payload encoders: float-only and float + channel byte.
+_PACK_F = struct.Struct("<f").pack
+_PACK_FB = struct.Struct("<fB").pack
+
+# Usage bar colors (green < 70% <= yellow < 90% <= red) and the reset code.
+_COLORS = ("\033[32m", "\033[33m", "\033[31m")
+_RESET = "\033[0m"
+
+# Every possible usage bar, indexed by the number of filled cells.
+_BAR_WIDTH = 30
+_BARS = tuple(
+    "\u2588" * i + "\u2591" * (_BAR_WIDTH - i) for i in range(_BAR_WIDTH + 1)
+)
+
 _OVERLAY_JS = """\
 (function(){
   var B="http://localhost:__PORT__",P=15000;
@@ -75,6 +89,8 @@ _OVERLAY_JS = """\
 
 def _make_web_handler(loop, conn, channel, js_content):
     """Create an HTTP handler that bridges browser POST → BLE write."""
+    js_body = js_content.encode()
+    js_length = str(len(js_body))
 
     class Handler(BaseHTTPRequestHandler):
         def _cors(self):
@@ -88,13 +104,12 @@ def _make_web_handler(loop, conn, channel, js_content):
             self.end_headers()
 
         def do_GET(self):
-            body = js_content.encode()
             self.send_response(200)
             self.send_header("Content-Type", "application/javascript")
-            self.send_header("Content-Length", str(len(body)))
+            self.send_header("Content-Length", js_length)
             self._cors()
             self.end_headers()
-            self.wfile.write(body)
+            self.wfile.write(js_body)
 
         def do_POST(self):
             try:
@@ -106,9 +121,9 @@ def _make_web_handler(loop, conn, channel, js_content):
                 ble_ok = False
                 if conn:
                     if channel is not None:
-                        payload = struct.pack("<fB", remaining, channel)
+                        payload = _PACK_FB(remaining, channel)
                     else:
-                        payload = struct.pack("<f", remaining)
+                        payload = _PACK_F(remaining)
                     try:
                         fut = asyncio.run_coroutine_threadsafe(
                             conn.write_raw(payload), loop,
@@ -119,17 +134,11 @@ def _make_web_handler(loop, conn, channel, js_content):
                         print(f"  \u26a0 BLE write failed: {e}")
 
                 # Terminal bar
-                bar_w = 30
-                filled = round(pct / 100 * bar_w)
-                bar = "\u2588" * filled + "\u2591" * (bar_w - filled)
-                if pct >= 90:
-                    c, r = "\033[31m", "\033[0m"
-                elif pct >= 70:
-                    c, r = "\033[33m", "\033[0m"
-                else:
-                    c, r = "\033[32m", "\033[0m"
+                filled = round(pct / 100 * _BAR_WIDTH)
+                bar = _BARS[min(max(filled, 0), _BAR_WIDTH)]
+                c = _COLORS[(pct >= 70) + (pct >= 90)]
                 ble_s = f" \u2192 galvo {remaining:.4f}" if ble_ok else " (no BLE)"
-                print(f"  {c}{bar}{r} {pct:.0f}% used{ble_s}")
+                print(f"  {c}{bar}{_RESET} {pct:.0f}% used{ble_s}")
 
                 resp = json.dumps({
                     "ack": ble_ok, "pct": pct, "galvo": round(remaining, 4),
@@ -194,6 +203,35 @@ def _parse_channel_value(s):
     return float(s), None
 
 
+# Options that take arguments, mapped to how many tokens they consume.
+_VALUE_OPTS = {"--channel": 1, "--name": 1, "--id": 1, "--rename": 2}
+_FLAG_OPTS = {"--help", "-h", "--scan", "--debug", "--claudewatch"}
+
+
+def _parse_args(argv):
+    """Split argv in one pass. Returns (opts, positional).
+
+    Flags map to True; value options map to the list of tokens they
+    consumed, which is shorter than expected if argv ran out.
+    """
+    opts = {}
+    positional = []
+    i = 0
+    while i < len(argv):
+        a = argv[i]
+        if a in _FLAG_OPTS:
+            opts[a] = True
+            i += 1
+        elif a in _VALUE_OPTS:
+            n = _VALUE_OPTS[a]
+            opts[a] = argv[i + 1:i + 1 + n]
+            i += 1 + n
+        else:
+            positional.append(a)
+            i += 1
+    return opts, positional
+
+
 async def do_scan():
     """Scan and print discovered galvos."""
     print("Scanning for GalvoCtrl devices (5s)...\n")
@@ -227,71 +265,62 @@ async def do_rename(identifier, new_name):
 # ── Main ─────────────────────────────────────────────────────────────────────
 
 async def main():
-    args = sys.argv[1:]
+    opts, args = _parse_args(sys.argv[1:])
 
-    if "--help" in args or "-h" in args:
+    if "--help" in opts or "-h" in opts:
         print(HELP_TEXT)
         sys.exit(0)
 
-    if "--scan" in args:
+    if "--scan" in opts:
         await do_scan()
         return
 
-    if "--rename" in args:
-        idx = args.index("--rename")
-        if idx + 2 >= len(args):
+    if "--rename" in opts:
+        rename_args = opts["--rename"]
+        if len(rename_args) < 2:
             print("--rename requires two arguments: ID and NAME")
             print("  ID is the device's current name or BLE address")
             print("  e.g. --rename GalvoCtrl MyGalvo")
             print("  e.g. --rename AA:BB:CC:DD:EE:FF MyGalvo")
             sys.exit(1)
-        await do_rename(args[idx + 1], args[idx + 2])
+        await do_rename(*rename_args)
         return
 
-    debug = "--debug" in args
-    if debug:
-        args.remove("--debug")
+    debug = "--debug" in opts
 
     # Check for --channel <n>
     channel = None
-    if "--channel" in args:
-        idx = args.index("--channel")
-        if idx + 1 >= len(args):
+    if "--channel" in opts:
+        if not opts["--channel"]:
             print("--channel requires a channel number (0-5)")
             sys.exit(1)
+        raw_channel = opts["--channel"][0]
         try:
-            channel = int(args[idx + 1])
+            channel = int(raw_channel)
             if channel < 0:
                 raise ValueError
         except ValueError:
-            print(f"Invalid --channel value: {args[idx + 1]}")
+            print(f"Invalid --channel value: {raw_channel}")
             sys.exit(1)
-        args = args[:idx] + args[idx + 2:]
 
     # Check for --name <device name>
     target_name = None
-    if "--name" in args:
-        idx = args.index("--name")
-        if idx + 1 >= len(args):
+    if "--name" in opts:
+        if not opts["--name"]:
             print("--name requires a device name")
             sys.exit(1)
-        target_name = args[idx + 1]
-        args = args[:idx] + args[idx + 2:]
+        target_name = opts["--name"][0]
 
     # Check for --id <BLE address>
     target_id = None
-    if "--id" in args:
-        idx = args.index("--id")
-        if idx + 1 >= len(args):
+    if "--id" in opts:
+        if not opts["--id"]:
             print("--id requires a BLE address")
             sys.exit(1)
-        target_id = args[idx + 1]
-        args = args[:idx] + args[idx + 2:]
+        target_id = opts["--id"][0]
 
     # Check for --claudewatch
-    claude_watch_mode = "--claudewatch" in args
-    if claude_watch_mode:
-        args.remove("--claudewatch")
+    claude_watch_mode = "--claudewatch" in opts
 
     # Connect
     try: